@@ -47,6 +47,16 @@ pub struct Setting {
         help = "MP3, Flac, AAC, WAV or Ogg Vorbis files in an album."
     )]
     source_files: Vec<PathBuf>,
+
+    #[arg(short, long, help = "Shows the progress of conversion.")]
+    verbose: bool,
+}
+
+impl Setting {
+    /// Whether the progress of conversion is shown.
+    pub fn is_verbose(&self) -> bool {
+        self.verbose
+    }
 }
 
 /// Result of convert_for_itunes.
@@ -283,6 +293,7 @@ mod tests {
             move_source_file_to: None,
             destination_directory: destination_directory.clone(),
             source_files: vec![source_file1.clone(), source_file2.clone()],
+            verbose: false,
         };
 
         let converted_file1 = PathBuf::from("converted1");
@@ -369,6 +380,7 @@ mod tests {
             move_source_file_to: Some(source_destination_directory.clone()),
             destination_directory: destination_directory.clone(),
             source_files: vec![source_file1.clone(), source_file2.clone()],
+            verbose: false,
         };
 
         let converted_file1 = PathBuf::from("converted1");
@@ -500,6 +512,7 @@ mod tests {
             destination_directory: destination_directory.clone(),
             move_source_file_to: Some(source_destination_directory),
             source_files: vec![source_file],
+            verbose: false,
         };
 
         let runner = {
@@ -534,6 +547,7 @@ mod tests {
             destination_directory: destination_directory.clone(),
             move_source_file_to: Some(source_destination_directory.clone()),
             source_files: vec![source_file],
+            verbose: false,
         };
 
         let runner = {
@@ -572,6 +586,7 @@ mod tests {
             destination_directory: destination_directory.clone(),
             move_source_file_to: Some(source_destination_directory.clone()),
             source_files: vec![source_file],
+            verbose: false,
         };
 
         let runner = {
@@ -606,6 +621,7 @@ mod tests {
             destination_directory: destination_directory.clone(),
             move_source_file_to: Some(source_destination_directory.clone()),
             source_files: vec![source_file],
+            verbose: false,
         };
 
         let runner = {
@@ -667,6 +683,7 @@ mod tests {
         let setting = Setting::try_parse_from(arguments).unwrap();
 
         assert!(setting.move_source_file_to.is_none());
+        assert!(!setting.is_verbose());
         assert_eq!(destination_directory, setting.destination_directory);
 
         assert_eq!(1, setting.source_files.len());
@@ -729,4 +746,21 @@ mod tests {
             setting.move_source_file_to.unwrap()
         );
     }
+
+    #[test]
+    fn parse_command_line_with_verbose() {
+        let destination_directory = PathBuf::from("destination");
+        let source_file = NamedTempFile::new().unwrap();
+
+        let arguments = &[
+            OsStr::new("command"),
+            OsStr::new("--verbose"),
+            destination_directory.as_os_str(),
+            source_file.path().as_os_str(),
+        ];
+
+        let setting = Setting::try_parse_from(arguments).unwrap();
+
+        assert!(setting.is_verbose());
+    }
 }
@@ -16,7 +16,7 @@ mod wav;
 
 use std::path::{Path, PathBuf};
 
-use crate::conversion_error::ConversionError;
+use crate::{conversion_error::ConversionError, utilities};
 
 use self::{
     aac::{AacGain, AacToMp3Converter},
@@ -89,7 +89,7 @@ pub trait ElementFactory {
 
 struct ElementGenerator {
     is_file: fn(&Path) -> bool,
-    create_analyzer: fn(&Path) -> Box<dyn Analyzer>,
+    create_analyzer: fn(&Path) -> Box<dyn Analyzer + Sync>,
     create_mp3_converter: fn() -> Box<dyn Mp3Converter>,
     create_metadata_writer: fn() -> Box<dyn MetadataWriter>,
 }
@@ -144,6 +144,47 @@ impl Elements {
     }
 }
 
+/// [`Analyzer`] for music files in different formats.
+///
+/// Music files are grouped by their formats. Each group is analyzed as an album in parallel.
+struct GroupedAnalyzer {
+    groups: Vec<(fn(&Path) -> bool, Box<dyn Analyzer + Sync>)>,
+}
+
+impl Analyzer for GroupedAnalyzer {
+    fn analyze(&self, source_paths_in_album: &[&Path]) -> Result<Vec<PathBuf>, ConversionError> {
+        let group_results = utilities::map_in_parallel(
+            &self.groups,
+            utilities::get_max_workers(self.groups.len()),
+            |(is_file, analyzer)| {
+                let (indices, group_paths): (Vec<usize>, Vec<&Path>) = source_paths_in_album
+                    .iter()
+                    .enumerate()
+                    .filter(|(_, path)| (*is_file)(path))
+                    .map(|(index, path)| (index, *path))
+                    .unzip();
+
+                analyzer.analyze(&group_paths).map(|analyzed_files| {
+                    indices.into_iter().zip(analyzed_files).collect::<Vec<_>>()
+                })
+            },
+        );
+
+        let mut analyzed_files: Vec<Option<PathBuf>> = vec![None; source_paths_in_album.len()];
+
+        for group_result in group_results {
+            for (index, analyzed_file) in group_result? {
+                analyzed_files[index] = Some(analyzed_file);
+            }
+        }
+
+        analyzed_files
+            .into_iter()
+            .collect::<Option<Vec<_>>>()
+            .ok_or(ConversionError::NotSupported)
+    }
+}
+
 struct NullMetadataWriter;
 
 impl MetadataWriter for NullMetadataWriter {
@@ -162,14 +203,44 @@ impl Mp3Converter for NotSupportedConverter {
 
 impl ElementFactory for Elements {
     fn create_analyzer(&self, source_files_in_album: &[&Path]) -> FactoryResult<dyn Analyzer> {
-        self.generators
+        if let Some(generator) = self
+            .generators
             .iter()
             .find(|generator| common::has_all_extension(source_files_in_album, generator.is_file))
-            .map_or(Err(ConversionError::NotSupported), |generator| {
-                Ok((generator.create_analyzer)(
-                    self.working_directory.as_path(),
-                ))
+        {
+            return Ok((generator.create_analyzer)(
+                self.working_directory.as_path(),
+            ));
+        }
+
+        let is_supported = |file: &&Path| {
+            self.generators
+                .iter()
+                .any(|generator| (generator.is_file)(file))
+        };
+
+        if !source_files_in_album.iter().all(is_supported) {
+            return Err(ConversionError::NotSupported);
+        }
+
+        // Music files in different formats are analyzed by each format.
+        let groups = self
+            .generators
+            .iter()
+            .filter(|generator| {
+                source_files_in_album
+                    .iter()
+                    .any(|file| (generator.is_file)(file))
+            })
+            .map(|generator| {
+                (
+                    generator.is_file,
+                    (generator.create_analyzer)(self.working_directory.as_path()),
+                )
             })
+            .collect();
+
+        Ok(Box::new(GroupedAnalyzer { groups }))
     }
 
     fn create_mp3_converter(&self, source_file: &Path) -> FactoryResult<dyn Mp3Converter> {
@@ -190,3 +261,104 @@ impl ElementFactory for Elements {
             })
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn create_analyzer_for_different_formats() {
+        let elements = Elements::new(Path::new("working"));
+
+        assert!(elements
+            .create_analyzer(&[Path::new("a.ogg"), Path::new("b.flac")])
+            .is_ok());
+    }
+
+    #[test]
+    fn create_analyzer_for_unsupported_format() {
+        let elements = Elements::new(Path::new("working"));
+
+        assert!(matches!(
+            elements.create_analyzer(&[Path::new("a.ogg"), Path::new("b.txt")]),
+            Err(ConversionError::NotSupported)
+        ));
+    }
+
+    fn create_grouped_analyzer(
+        ogg_vorbis_analyzer: MockAnalyzer,
+        flac_analyzer: MockAnalyzer,
+    ) -> GroupedAnalyzer {
+        GroupedAnalyzer {
+            groups: vec![
+                (
+                    |file| ogg_vorbis::is_ogg_vorbis(file),
+                    Box::new(ogg_vorbis_analyzer),
+                ),
+                (|file| flac::is_flac(file), Box::new(flac_analyzer)),
+            ],
+        }
+    }
+
+    #[test]
+    fn analyze_by_groups_in_album_order() {
+        let mut ogg_vorbis_analyzer = MockAnalyzer::new();
+        let mut flac_analyzer = MockAnalyzer::new();
+
+        ogg_vorbis_analyzer
+            .expect_analyze()
+            .withf(|source_files| {
+                source_files.to_vec() == vec![Path::new("a.ogg"), Path::new("c.ogg")]
+            })
+            .times(1)
+            .returning(|_| {
+                Ok(vec![
+                    PathBuf::from("analyzed_a.ogg"),
+                    PathBuf::from("analyzed_c.ogg"),
+                ])
+            });
+        flac_analyzer
+            .expect_analyze()
+            .withf(|source_files| source_files.to_vec() == vec![Path::new("b.flac")])
+            .times(1)
+            .returning(|_| Ok(vec![PathBuf::from("analyzed_b.flac")]));
+
+        let analyzer = create_grouped_analyzer(ogg_vorbis_analyzer, flac_analyzer);
+
+        assert_eq!(
+            analyzer
+                .analyze(&[Path::new("a.ogg"), Path::new("b.flac"), Path::new("c.ogg")])
+                .unwrap(),
+            vec![
+                PathBuf::from("analyzed_a.ogg"),
+                PathBuf::from("analyzed_b.flac"),
+                PathBuf::from("analyzed_c.ogg"),
+            ]
+        );
+    }
+
+    #[test]
+    fn analyze_by_groups_with_failed_group() {
+        let mut ogg_vorbis_analyzer = MockAnalyzer::new();
+        let mut flac_analyzer = MockAnalyzer::new();
+
+        ogg_vorbis_analyzer.expect_analyze().returning(|_| {
+            Ok(vec![
+                PathBuf::from("analyzed_a.ogg"),
+                PathBuf::from("analyzed_c.ogg"),
+            ])
+        });
+        flac_analyzer.expect_analyze().returning(|_| {
+            Err(ConversionError::IoError {
+                error: std::io::Error::other("analysis is failed"),
+            })
+        });
+
+        let analyzer = create_grouped_analyzer(ogg_vorbis_analyzer, flac_analyzer);
+
+        assert!(matches!(
+            analyzer.analyze(&[Path::new("a.ogg"), Path::new("b.flac"), Path::new("c.ogg")]),
+            Err(ConversionError::IoError { .. })
+        ));
+    }
+}
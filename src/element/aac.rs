@@ -53,10 +53,8 @@ impl Mp3Converter for AacToMp3Converter {
         source_file: &Path,
         destination_file: &Path,
     ) -> Result<(), crate::conversion_error::ConversionError> {
-        let (wav_path, _temporary_directory) = common::create_temporary_wav_file_path()?;
+        let mut decoder = ffmpeg::create_wav_decoder(source_file)?;
 
-        ffmpeg::convert_to_wav(source_file, &wav_path)?;
-
-        lame::convert_to_mp3(&wav_path, destination_file)
+        lame::convert_output_to_mp3(&mut decoder, destination_file)
     }
 }
@@ -5,40 +5,47 @@
 //! Common functions for elements.
 
 use std::{
+    collections::HashMap,
     path::{Path, PathBuf},
-    process::Command,
+    process::{Command, ExitStatus, Stdio},
+    sync::{Mutex, OnceLock},
 };
 
-use tempfile::TempDir;
 use which::which;
 
-use crate::{conversion_error::ConversionError, utilities};
+use crate::conversion_error::ConversionError;
+
+/// Paths of commands that are found by [`get_command`].
+static COMMAND_PATHS: OnceLock<Mutex<HashMap<String, PathBuf>>> = OnceLock::new();
 
 /// Gets a [`Command`] from a string that represents a command.
+///
+/// The path of a command is searched only once. It is reused for the following calls.
 pub fn get_command(command: &str) -> Result<Command, ConversionError> {
-    let command_path = which(command);
-
-    command_path
-        .map(Command::new)
-        .map_err(|error| ConversionError::CommandNotFound {
-            command: command.to_string(),
-            error,
-        })
-}
-
-/// Runs a command.
-pub fn run_command(command: &mut Command) -> Result<(), ConversionError> {
-    let result = command.status();
+    let command_paths = COMMAND_PATHS.get_or_init(Default::default);
 
-    fn get_program(command: &Command) -> String {
-        command.get_program().to_string_lossy().to_string()
+    if let Some(command_path) = command_paths.lock().unwrap().get(command) {
+        return Ok(Command::new(command_path));
     }
 
-    let exit_status = result.map_err(|error| ConversionError::CommandCannotExecuted {
-        command: get_program(command),
+    let command_path = which(command).map_err(|error| ConversionError::CommandNotFound {
+        command: command.to_string(),
         error,
     })?;
 
+    command_paths
+        .lock()
+        .unwrap()
+        .insert(command.to_string(), command_path.clone());
+
+    Ok(Command::new(command_path))
+}
+
+fn get_program(command: &Command) -> String {
+    command.get_program().to_string_lossy().to_string()
+}
+
+fn check_exit_status(command: &Command, exit_status: ExitStatus) -> Result<(), ConversionError> {
     if exit_status.success() {
         Ok(())
     } else {
@@ -49,27 +56,81 @@ pub fn run_command(command: &mut Command) -> Result<(), ConversionError> {
     }
 }
 
-/// Creates a [`Vec`] of [`PathBuf`] from a slice of &[`Path`].
-pub fn create_path_bufs(paths: &[&Path]) -> Vec<PathBuf> {
-    paths.iter().map(|path| path.to_path_buf()).collect()
+/// Runs a command.
+pub fn run_command(command: &mut Command) -> Result<(), ConversionError> {
+    let result = command.status();
+
+    let exit_status = result.map_err(|error| ConversionError::CommandCannotExecuted {
+        command: get_program(command),
+        error,
+    })?;
+
+    check_exit_status(command, exit_status)
 }
 
-/// Creates a temporary file for wav file to decode compressed music file.
+/// Runs two commands that are connected by a pipe.
+///
+/// The standard output of `producer` is passed to the standard input of `consumer`.
+/// So they run at the same time without an intermediate file.
 ///
-/// This function returns the path of a temporary file and the directory that contains it
-/// to keep the directory.
-pub fn create_temporary_wav_file_path() -> Result<(PathBuf, TempDir), ConversionError> {
-    let temporary_directory = utilities::create_temporary_directory()?;
+/// When both commands fail, the failure of `producer` is returned.
+pub fn run_piped_commands(
+    producer: &mut Command,
+    consumer: &mut Command,
+) -> Result<(), ConversionError> {
+    let spawn_result = producer.stdout(Stdio::piped()).spawn();
+
+    let mut producer_process =
+        spawn_result.map_err(|error| ConversionError::CommandCannotExecuted {
+            command: get_program(producer),
+            error,
+        })?;
+
+    // The standard output is always available because it is piped.
+    let producer_output = producer_process.stdout.take().unwrap();
+
+    let consumer_result = run_command(consumer.stdin(producer_output));
+
+    // The producer is checked while the pipe is still open. So a producer that is stopped by
+    // the closed pipe is not regarded as failed.
+    let producer_status = consumer_result
+        .as_ref()
+        .err()
+        .and_then(|_| producer_process.try_wait().ok().flatten());
+
+    // The read end of the pipe is closed so that the producer is not blocked by a full pipe
+    // when the consumer exits without reading all data.
+    consumer.stdin(Stdio::null());
+
+    if let Err(error) = consumer_result {
+        // The consumer may fail because the producer failed before it and output nothing.
+        // So the failure of the producer is reported first.
+        if let Some(exit_status) = producer_status {
+            check_exit_status(producer, exit_status)?;
 
-    let wav_path = {
-        let mut path = PathBuf::from(temporary_directory.path());
+            return Err(error);
+        }
 
-        path.push("source.wav");
+        let _ = producer_process.kill();
+        let _ = producer_process.wait();
 
-        path
-    };
+        return Err(error);
+    }
+
+    let exit_status =
+        producer_process
+            .wait()
+            .map_err(|error| ConversionError::CommandCannotExecuted {
+                command: get_program(producer),
+                error,
+            })?;
 
-    Ok((wav_path, temporary_directory))
+    check_exit_status(producer, exit_status)
+}
+
+/// Creates a [`Vec`] of [`PathBuf`] from a slice of &[`Path`].
+pub fn create_path_bufs(paths: &[&Path]) -> Vec<PathBuf> {
+    paths.iter().map(|path| path.to_path_buf()).collect()
 }
 
 /// Whether a `file` has the `extension`.
@@ -105,4 +166,97 @@ mod tests {
     fn check_no_ogg_extension() {
         assert!(!has_extension("ogg", "file.flac"));
     }
+
+    #[test]
+    fn get_cached_command() {
+        COMMAND_PATHS
+            .get_or_init(Default::default)
+            .lock()
+            .unwrap()
+            .insert(
+                "cached-command-for-test".to_string(),
+                PathBuf::from("cached/command"),
+            );
+
+        // The command is not searched because its path is cached.
+        assert_eq!(
+            get_command("cached-command-for-test")
+                .unwrap()
+                .get_program(),
+            "cached/command"
+        );
+    }
+
+    #[test]
+    fn get_not_found_command() {
+        assert!(matches!(
+            get_command("not-found-command-for-test"),
+            Err(ConversionError::CommandNotFound { command, .. })
+            if command == "not-found-command-for-test"
+        ));
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn run_piped_commands_successfully() {
+        let mut producer = Command::new("echo");
+        let mut consumer = Command::new("cat");
+
+        producer.arg("test");
+        consumer.stdout(Stdio::null());
+
+        assert!(run_piped_commands(&mut producer, &mut consumer).is_ok());
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn run_piped_commands_with_failed_producer() {
+        let mut producer = Command::new("false");
+        let mut consumer = Command::new("cat");
+
+        consumer.stdout(Stdio::null());
+
+        assert!(matches!(
+            run_piped_commands(&mut producer, &mut consumer),
+            Err(ConversionError::CommandFailed { command, .. }) if command == "false"
+        ));
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn run_piped_commands_with_failed_consumer() {
+        let mut producer = Command::new("yes");
+        let mut consumer = Command::new("false");
+
+        assert!(matches!(
+            run_piped_commands(&mut producer, &mut consumer),
+            Err(ConversionError::CommandFailed { command, .. }) if command == "false"
+        ));
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn run_piped_commands_with_consumer_not_reading_all() {
+        let mut producer = Command::new("yes");
+        let mut consumer = Command::new("true");
+
+        assert!(matches!(
+            run_piped_commands(&mut producer, &mut consumer),
+            Err(ConversionError::CommandFailed { command, .. }) if command == "yes"
+        ));
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn run_piped_commands_with_failed_producer_and_consumer() {
+        let mut producer = Command::new("false");
+        let mut consumer = Command::new("sh");
+
+        consumer.arg("-c").arg("cat > /dev/null; exit 1");
+
+        assert!(matches!(
+            run_piped_commands(&mut producer, &mut consumer),
+            Err(ConversionError::CommandFailed { command, .. }) if command == "false"
+        ));
+    }
 }
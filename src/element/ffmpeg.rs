@@ -4,7 +4,7 @@
 
 //! A module for FFmpeg.
 
-use std::path::Path;
+use std::{path::Path, process::Command};
 
 use crate::{conversion_error::ConversionError, element::common};
 
@@ -12,21 +12,27 @@ use crate::{conversion_error::ConversionError, element::common};
 //
 // ffmpeg -i <input> -filter:a "volume=replaygain=album" <output>.wav
 
-/// Converts a source music file to an MP3 file.
+/// Creates a command that decodes a source music file.
 ///
-/// `source_file` is converted to a `destination_file` as an MP3 file.
-pub fn convert_to_wav(source_file: &Path, destination_file: &Path) -> Result<(), ConversionError> {
+/// The command outputs `source_file` as WAV data to the standard output.
+pub fn create_wav_decoder(source_file: &Path) -> Result<Command, ConversionError> {
     const COMMAND_NAME: &str = "ffmpeg";
 
     let mut ffmpeg = common::get_command(COMMAND_NAME)?;
-    let command = ffmpeg
+
+    // FFmpeg does not read keys from the terminal. Otherwise a killed FFmpeg leaves the
+    // terminal settings changed.
+    ffmpeg
+        .arg("-nostdin")
         .arg("-loglevel")
         .arg("error")
         .arg("-i")
         .arg(source_file)
         .arg("-filter:a")
         .arg("volume=replaygain=album")
-        .arg(destination_file);
+        .arg("-f")
+        .arg("wav")
+        .arg("-");
 
-    common::run_command(command)
+    Ok(ffmpeg)
 }
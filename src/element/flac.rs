@@ -4,9 +4,10 @@
 
 //! An element for FLAC files.
 
-use std::path::{Path, PathBuf};
-
-use tempfile::TempDir;
+use std::{
+    path::{Path, PathBuf},
+    process::Command,
+};
 
 use crate::conversion_error::ConversionError;
 
@@ -64,34 +65,29 @@ pub fn convert_wav_to_flac(
 
 /// [`Mp3Converter`] for FLAC.
 ///
-/// flac and LAME is used.
+/// flac and LAME are used. flac decodes the source with replaygain and pipes it to LAME.
 pub struct FlacToMp3Converter;
 
 impl FlacToMp3Converter {
-    fn convert_to_wav(&self, source_file: &Path) -> Result<(PathBuf, TempDir), ConversionError> {
+    fn create_decoder(&self, source_file: &Path) -> Result<Command, ConversionError> {
         const COMMAND_NAME: &str = "flac";
 
-        let (wav_file_path, temporary_directory) = common::create_temporary_wav_file_path()?;
-
         let mut flac = common::get_command(COMMAND_NAME)?;
-        let command = flac
-            .arg("--totally-silent")
+
+        flac.arg("--totally-silent")
             .arg("-d")
             .arg("--apply-replaygain-which-is-not-lossless")
-            .arg("-o")
-            .arg(&wav_file_path)
+            .arg("-c")
             .arg(source_file);
 
-        common::run_command(command)?;
-
-        Ok((wav_file_path, temporary_directory))
+        Ok(flac)
     }
 }
 
 impl Mp3Converter for FlacToMp3Converter {
     fn convert(&self, source_file: &Path, destination_file: &Path) -> Result<(), ConversionError> {
-        let (wav_file, _temprary_directory) = self.convert_to_wav(source_file)?;
+        let mut decoder = self.create_decoder(source_file)?;
 
-        lame::convert_to_mp3(&wav_file, destination_file)
+        lame::convert_output_to_mp3(&mut decoder, destination_file)
     }
 }
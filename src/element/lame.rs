@@ -4,20 +4,52 @@
 
 //! A module to use LAME.
 
-use std::path::Path;
+use std::{ffi::OsStr, fs, path::Path, process::Command};
 
 use crate::{conversion_error::ConversionError, element::common};
 
-/// Converts an WAV file or an MP3 file to MP3 file.
-pub fn convert_to_mp3(source_file: &Path, destination_file: &Path) -> Result<(), ConversionError> {
+fn create_command<S: AsRef<OsStr>>(
+    options: &[&str],
+    source: S,
+    destination_file: &Path,
+) -> Result<Command, ConversionError> {
     const COMMAND_NAME: &str = "lame";
 
     let mut lame = common::get_command(COMMAND_NAME)?;
-    let command = lame
-        .arg("-V5")
+
+    lame.arg("-V5")
         .arg("--silent")
-        .arg(source_file)
+        .args(options)
+        .arg(source)
         .arg(destination_file);
 
-    common::run_command(command)
+    Ok(lame)
+}
+
+/// Re-converts an MP3 file to MP3 file.
+///
+/// The source is decoded by the MP3 decoder of LAME without detecting its format.
+pub fn reconvert_mp3(source_file: &Path, destination_file: &Path) -> Result<(), ConversionError> {
+    let mut lame = create_command(&["--mp3input"], source_file, destination_file)?;
+
+    common::run_command(&mut lame)
+}
+
+/// Converts WAV data that `decoder` outputs to MP3 file.
+///
+/// The standard output of `decoder` is piped to LAME.
+///
+/// LAME writes `destination_file` while `decoder` runs. So `destination_file` is removed when
+/// the conversion is failed.
+pub fn convert_output_to_mp3(
+    decoder: &mut Command,
+    destination_file: &Path,
+) -> Result<(), ConversionError> {
+    const STANDARD_INPUT: &str = "-";
+
+    let mut lame = create_command(&[], STANDARD_INPUT, destination_file)?;
+
+    common::run_piped_commands(decoder, &mut lame).inspect_err(|_| {
+        let _ = fs::remove_file(destination_file);
+    })
 }
@@ -25,7 +25,7 @@ pub struct Mp3Reconverter;
 
 impl Mp3Converter for Mp3Reconverter {
     fn convert(&self, source_file: &Path, destination_file: &Path) -> Result<(), ConversionError> {
-        lame::convert_to_mp3(source_file, destination_file)
+        lame::reconvert_mp3(source_file, destination_file)
     }
 }
 
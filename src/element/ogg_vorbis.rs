@@ -4,7 +4,10 @@
 
 //! An element for Ogg Vorbis files.
 
-use std::path::{Path, PathBuf};
+use std::{
+    path::{Path, PathBuf},
+    process::Command,
+};
 
 use crate::conversion_error::ConversionError;
 
@@ -35,35 +38,25 @@ impl Analyzer for OggVorbisGain {
 
 /// An [`Mp3Converter] for Ogg Vorbis files.
 ///
-/// ogg123 and LAME are used.
+/// oggdec and LAME are used.
 pub struct OggVorbisToMp3Converter;
 
 impl OggVorbisToMp3Converter {
-    fn convert_to_wav(
-        &self,
-        source_file: &Path,
-        destination_wav_path: &Path,
-    ) -> Result<(), ConversionError> {
-        const COMMAND_NAME: &str = "ogg123";
-
-        let mut ogg123 = common::get_command(COMMAND_NAME)?;
-        let command = ogg123
-            .arg("-q")
-            .arg("-d")
-            .arg("wav")
-            .arg("-f")
-            .arg(destination_wav_path)
-            .arg(source_file);
-
-        common::run_command(command)
+    fn create_decoder(&self, source_file: &Path) -> Result<Command, ConversionError> {
+        const COMMAND_NAME: &str = "oggdec";
+
+        let mut oggdec = common::get_command(COMMAND_NAME)?;
+
+        oggdec.arg("-Q").arg("-o").arg("-").arg(source_file);
+
+        Ok(oggdec)
     }
 }
 
 impl Mp3Converter for OggVorbisToMp3Converter {
     fn convert(&self, source_file: &Path, destination_file: &Path) -> Result<(), ConversionError> {
-        let (wav_path, _temporary_directory) = common::create_temporary_wav_file_path()?;
+        let mut decoder = self.create_decoder(source_file)?;
 
-        self.convert_to_wav(source_file, &wav_path)?;
-        lame::convert_to_mp3(&wav_path, destination_file)
+        lame::convert_output_to_mp3(&mut decoder, destination_file)
     }
 }
@@ -6,7 +6,7 @@
 
 use std::path::{Path, PathBuf};
 
-use crate::conversion_error::ConversionError;
+use crate::{conversion_error::ConversionError, utilities};
 
 use super::{common, flac, Analyzer};
 
@@ -37,20 +37,28 @@ impl Analyzer for WavFlacAnalyzer {
         &self,
         source_paths_in_album: &[&Path],
     ) -> Result<Vec<std::path::PathBuf>, ConversionError> {
-        let all_flac_files = source_paths_in_album
-            .iter()
-            .enumerate()
-            .map(|(index, wav_path)| {
-                let flac_path = {
-                    let mut path = self.working_directory.to_path_buf();
-
-                    path.push(format!("source_{}.flac", index));
-                    path
-                };
+        let all_flac_files: Vec<_> = (0..source_paths_in_album.len())
+            .map(|index| {
+                let mut path = self.working_directory.to_path_buf();
 
-                flac::convert_wav_to_flac(wav_path, &flac_path).map(|_| flac_path)
+                path.push(format!("source_{}.flac", index));
+                path
             })
-            .collect::<Result<Vec<_>, _>>()?;
+            .collect();
+
+        // Each WAV file is encoded separately. Only replaygain needs all files of the album.
+        let conversion_targets: Vec<_> = source_paths_in_album
+            .iter()
+            .zip(all_flac_files.iter())
+            .collect();
+
+        utilities::map_in_parallel(
+            &conversion_targets,
+            utilities::get_max_workers(conversion_targets.len()),
+            |(wav_path, flac_path)| flac::convert_wav_to_flac(wav_path, flac_path),
+        )
+        .into_iter()
+        .collect::<Result<(), _>>()?;
 
         flac::apply_replaygain(
             all_flac_files
@@ -5,10 +5,11 @@
 //! Move source files to a directory.
 
 use std::{
-    collections::HashMap,
+    collections::{HashMap, HashSet},
     fs::{self, DirBuilder},
     io,
     path::{Path, PathBuf},
+    sync::atomic::{AtomicBool, Ordering},
 };
 
 use anyhow::Result;
@@ -16,7 +17,10 @@ use log::{error, info};
 use sanitize_filename;
 use thiserror::Error;
 
-use crate::metadata::{LoftyMetadataParser, MetadataParser, MusicMetadata};
+use crate::{
+    metadata::{LoftyMetadataParser, MetadataParser, MusicMetadata},
+    utilities,
+};
 
 /// The result of a moving source file.
 #[derive(Debug)]
@@ -127,10 +131,34 @@ impl FileMover {
         filename
     }
 
+    fn get_album_directory(
+        &self,
+        album_artist: &str,
+        album_name: &str,
+        album_directories: &mut HashMap<(String, String), PathBuf>,
+    ) -> PathBuf {
+        album_directories
+            .entry((album_artist.to_owned(), album_name.to_owned()))
+            .or_insert_with(|| {
+                let mut album_directory = self.destination_directory.clone();
+
+                album_directory.push(Self::sanitize_filename(album_artist));
+                album_directory.push(Self::sanitize_filename(album_name));
+
+                album_directory
+            })
+            .clone()
+    }
+
+    /// Gets the destination path of a source file.
+    ///
+    /// Files in an album share their album directory. So the path of the album directory is
+    /// built once for an album and reused from `album_directories`.
     fn get_destination_path<T: AsRef<Path>>(
         &self,
         source_file: T,
         metadata: &MusicMetadata,
+        album_directories: &mut HashMap<(String, String), PathBuf>,
     ) -> PathBuf {
         let album_artist = metadata
             .album_artist
@@ -141,10 +169,9 @@ impl FileMover {
             .as_ref()
             .map_or(Self::UNKNOWN_ALBUM, |album_name| album_name);
 
-        let mut destination_path = self.destination_directory.clone();
+        let mut destination_path =
+            self.get_album_directory(album_artist, album_name, album_directories);
 
-        destination_path.push(Self::sanitize_filename(album_artist));
-        destination_path.push(Self::sanitize_filename(album_name));
         destination_path.push(Self::sanitize_filename(
             Self::create_filename(source_file, metadata).as_str(),
         ));
@@ -152,6 +179,10 @@ impl FileMover {
         destination_path
     }
 
+    /// Moves a file from `from` to `to`.
+    ///
+    /// The file is renamed when both paths are on the same file system, so its data is not
+    /// rewritten. Otherwise renaming fails and the file is copied and removed.
     fn move_file_to_destination<T, U>(from: T, to: U) -> io::Result<()>
     where
         T: AsRef<Path>,
@@ -159,11 +190,9 @@ impl FileMover {
     {
         debug_assert!(to.as_ref().is_absolute());
 
-        if let Some(parent_directory) = to.as_ref().parent() {
-            DirBuilder::new().recursive(true).create(parent_directory)?;
-        }
-
         if fs::rename(&from, &to).is_err() {
+            // fs::copy uses copy functions of the system. For example, copy_file_range on Linux
+            // copies in the kernel and can share extents on file systems that support it.
             fs::copy(&from, &to)?;
             fs::remove_file(&from)?;
         }
@@ -171,24 +200,24 @@ impl FileMover {
         Ok(())
     }
 
-    fn move_file(&self, moving_file: &MovedFile) -> Result<(), FileMovingError> {
+    fn move_file(moving_file: &MovedFile) -> Result<(), FileMovingError> {
         Self::move_file_to_destination(&moving_file.source, &moving_file.destination)
             .map_err(FileMovingError::IoError)
     }
 
-    fn get_moving_file<T: AsRef<Path>>(
-        &self,
-        target_file: T,
-    ) -> Result<MovedFile, FileMovingError> {
-        let target_file = target_file.as_ref();
-
-        self.metadata_parser
-            .parse(target_file)
-            .map(|metadata| MovedFile {
-                source: target_file.to_path_buf(),
-                destination: self.get_destination_path(target_file, &metadata),
-            })
-            .map_err(FileMovingError::ReadingMetadataIsFailed)
+    fn create_destination_directories(moving_files: &[MovedFile]) -> io::Result<()> {
+        let destination_directories: HashSet<_> = moving_files
+            .iter()
+            .filter_map(|moving_file| moving_file.destination.parent())
+            .collect();
+
+        for destination_directory in destination_directories {
+            DirBuilder::new()
+                .recursive(true)
+                .create(destination_directory)?;
+        }
+
+        Ok(())
     }
 
     fn check_duplication(moving_files: &[MovedFile]) -> Result<(), FileMovingError> {
@@ -227,27 +256,71 @@ impl FileMover {
     }
 
     /// Moves files to a directory.
-    pub fn move_files<T: AsRef<Path>>(
+    pub fn move_files<T: AsRef<Path> + Sync>(
         &self,
         moving_files: &[T],
     ) -> Result<Vec<MovedFile>, FileMovingError> {
-        let moved_files = moving_files
+        // Reading metadata waits for I/O of each file. So files are read in parallel.
+        let all_metadata = utilities::map_in_parallel(
+            moving_files,
+            utilities::get_max_workers(moving_files.len()),
+            |target_file| self.metadata_parser.parse(target_file.as_ref()),
+        )
+        .into_iter()
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(FileMovingError::ReadingMetadataIsFailed)?;
+
+        let mut album_directories = HashMap::new();
+        let moved_files: Vec<_> = moving_files
             .iter()
-            .map(|target_file| self.get_moving_file(target_file))
-            .collect::<Result<Vec<_>, _>>()?;
+            .zip(all_metadata.iter())
+            .map(|(target_file, metadata)| MovedFile {
+                source: target_file.as_ref().to_path_buf(),
+                destination: self.get_destination_path(
+                    target_file,
+                    metadata,
+                    &mut album_directories,
+                ),
+            })
+            .collect();
 
         Self::check_duplication(&moved_files)?;
 
-        for moving_file in &moved_files {
-            self.move_file(moving_file)
-                .inspect(|_| {
-                    info!(
-                        "{:?} was moved to {:?}",
-                        moving_file.source, moving_file.destination
-                    )
-                })
-                .inspect_err(|error| error!("Moving file is failed: {}", error))?;
-        }
+        // Directories are created before moving files to not create the same directory at once.
+        Self::create_destination_directories(&moved_files).map_err(FileMovingError::IoError)?;
+
+        // Files are moved in parallel because copying between file systems waits for I/O.
+        const MAX_MOVING_WORKERS: usize = 8;
+
+        // No more moves are started after a move is failed. Moves that are already running are
+        // finished.
+        let is_failed = AtomicBool::new(false);
+
+        let moving_results = utilities::map_in_parallel(
+            &moved_files,
+            utilities::get_max_workers(moved_files.len()).min(MAX_MOVING_WORKERS),
+            |moving_file| {
+                if is_failed.load(Ordering::Relaxed) {
+                    // The skipped move is not an error. The error of the failed move is returned.
+                    return Ok(());
+                }
+
+                Self::move_file(moving_file)
+                    .inspect(|_| {
+                        info!(
+                            "{:?} was moved to {:?}",
+                            moving_file.source, moving_file.destination
+                        )
+                    })
+                    .inspect_err(|error| {
+                        is_failed.store(true, Ordering::Relaxed);
+
+                        error!("Moving file is failed: {}", error)
+                    })
+            },
+        );
+
+        moving_results.into_iter().collect::<Result<(), _>>()?;
 
         Ok(moved_files)
     }
@@ -10,17 +10,21 @@ use convert_for_itunes::convert_for_itunes::{convert_for_itunes, ConvertForITune
 use env_logger::Env;
 use log::error;
 
-fn initialize_logging() {
-    env_logger::Builder::from_env(Env::default().default_filter_or("info"))
+fn initialize_logging(setting: &Setting) {
+    let default_level = if setting.is_verbose() { "info" } else { "warn" };
+
+    env_logger::Builder::from_env(Env::default().default_filter_or(default_level))
         .format_target(false)
         .format_timestamp(None)
         .init();
 }
 
 fn main() {
-    initialize_logging();
+    let setting = Setting::parse();
+
+    initialize_logging(&setting);
 
-    let result = convert_for_itunes(&Setting::parse());
+    let result = convert_for_itunes(&setting);
 
     if result.is_err() {
         match result.unwrap_err() {
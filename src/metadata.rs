@@ -12,9 +12,11 @@ use std::{
 
 use anyhow::Result;
 use lofty::{
-    config::WriteOptions,
-    file::{TaggedFile, TaggedFileExt},
+    config::{ParseOptions, WriteOptions},
+    error::LoftyError,
+    file::TaggedFileExt,
     id3::v2::Id3v2Tag,
+    probe::Probe,
     tag::{items::ENGLISH, Accessor, ItemKey, Tag, TagExt},
 };
 
@@ -23,7 +25,7 @@ use crate::conversion_error::ConversionError;
 /// Metadata of a music file.
 ///
 /// The artist of a track is not treated because it is not used for locating music files.
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Default)]
 pub struct MusicMetadata {
     pub album_name: Option<String>,
 
@@ -37,8 +39,10 @@ pub struct MusicMetadata {
 }
 
 /// Parses metadata.
+///
+/// Files may be parsed from multiple threads.
 #[cfg_attr(test, mockall::automock)]
-pub trait MetadataParser {
+pub trait MetadataParser: Sync {
     /// Prases the metadata of a music file.
     fn parse(&self, file: &Path) -> Result<MusicMetadata>;
 }
@@ -51,12 +55,7 @@ impl fmt::Debug for dyn MetadataParser {
 
 fn get_number_pair(text: &str) -> (Option<u32>, Option<u32>) {
     text.split_once('/')
-        .map(|text| {
-            (
-                text.0.parse::<u32>().map(Some).unwrap_or(None),
-                text.1.parse::<u32>().map(Some).unwrap_or(None),
-            )
-        })
+        .map(|(number, total)| (number.parse().ok(), total.parse().ok()))
         .unwrap_or((None, None))
 }
 
@@ -66,6 +65,19 @@ fn get_number_pair_from_tag(key: &ItemKey, tag: &Tag) -> (Option<u32>, Option<u3
         .unwrap_or((None, None))
 }
 
+/// Reads the primary tag of a music file.
+///
+/// The tag is taken from the read file instead of copying it. Audio properties are not read
+/// because only tags are used.
+fn read_primary_tag(file: &Path) -> Result<Option<Tag>, LoftyError> {
+    let mut tagged_file = Probe::open(file)?
+        .options(ParseOptions::new().read_properties(false))
+        .read()?;
+    let primary_tag_type = tagged_file.primary_tag_type();
+
+    Ok(tagged_file.remove(primary_tag_type))
+}
+
 pub struct LoftyMetadataParser;
 
 impl LoftyMetadataParser {
@@ -96,25 +108,20 @@ impl LoftyMetadataParser {
 
 impl MetadataParser for LoftyMetadataParser {
     fn parse(&self, path: &Path) -> Result<MusicMetadata> {
-        let tagged_file = lofty::read_from_path(path)?;
-        let tag = tagged_file.primary_tag();
+        let Some(tag) = read_primary_tag(path)? else {
+            return Ok(MusicMetadata::default());
+        };
 
         Ok(MusicMetadata {
-            album_name: tag.and_then(|tag| tag.album().map(|album| album.into_owned())),
-            album_artist: tag.and_then(LoftyMetadataParser::get_album_artist),
-            track_name: tag.and_then(|tag| tag.title().map(|title| title.into_owned())),
-            track_number: tag.and_then(LoftyMetadataParser::get_track_number),
-            disk_number: tag.and_then(LoftyMetadataParser::get_disk_number),
+            album_name: tag.album().map(|album| album.into_owned()),
+            album_artist: LoftyMetadataParser::get_album_artist(&tag),
+            track_name: tag.title().map(|title| title.into_owned()),
+            track_number: LoftyMetadataParser::get_track_number(&tag),
+            disk_number: LoftyMetadataParser::get_disk_number(&tag),
         })
     }
 }
 
-fn read_tagged_file(source_file: &Path) -> Result<TaggedFile, ConversionError> {
-    lofty::read_from_path(source_file).map_err(|error| ConversionError::CannotReadMetadata {
-        cause: error.to_string(),
-    })
-}
-
 fn convert_to_id3v2(mut tag: Tag) -> Id3v2Tag {
     fn get_no_number_string(key: &ItemKey, tag: &Tag) -> Option<String> {
         tag.get_string(key)
@@ -133,25 +140,24 @@ fn convert_to_id3v2(mut tag: Tag) -> Id3v2Tag {
         tag.remove_key(key);
     }
 
-    if let Some(no_number_track) = get_no_number_string(&ItemKey::TrackNumber, &tag) {
-        let (number, total) = get_number_pair(&no_number_track);
+    type NumberSetter = fn(&mut Tag, u32);
 
-        if let Some(number) = number {
-            tag.set_track(number);
-        }
-        if let Some(total) = total {
-            tag.set_track_total(total);
-        }
-    }
+    // Items that may be "number/total" text, and setters of the number and the total.
+    const NUMBER_PAIR_ITEMS: &[(ItemKey, NumberSetter, NumberSetter)] = &[
+        (ItemKey::TrackNumber, Tag::set_track, Tag::set_track_total),
+        (ItemKey::DiscNumber, Tag::set_disk, Tag::set_disk_total),
+    ];
 
-    if let Some(no_number_disk) = get_no_number_string(&ItemKey::DiscNumber, &tag) {
-        let (number, total) = get_number_pair(&no_number_disk);
+    for (key, set_number, set_total) in NUMBER_PAIR_ITEMS {
+        if let Some(no_number_text) = get_no_number_string(key, &tag) {
+            let (number, total) = get_number_pair(&no_number_text);
 
-        if let Some(number) = number {
-            tag.set_disk(number);
-        }
-        if let Some(total) = total {
-            tag.set_disk_total(total);
+            if let Some(number) = number {
+                set_number(&mut tag, number);
+            }
+            if let Some(total) = total {
+                set_total(&mut tag, total);
+            }
         }
     }
 
@@ -166,12 +172,15 @@ fn convert_to_id3v2(mut tag: Tag) -> Id3v2Tag {
 }
 
 pub fn copy_metadata(source_file: &Path, target_file: &Path) -> Result<(), ConversionError> {
-    let source_tagged_file = read_tagged_file(source_file)?;
-    let Some(source_tag) = source_tagged_file.primary_tag() else {
+    let source_tag =
+        read_primary_tag(source_file).map_err(|error| ConversionError::CannotReadMetadata {
+            cause: error.to_string(),
+        })?;
+    let Some(source_tag) = source_tag else {
         return Ok(());
     };
 
-    let id3v2_tag = convert_to_id3v2(source_tag.to_owned());
+    let id3v2_tag = convert_to_id3v2(source_tag);
 
     id3v2_tag
         .save_to_path(target_file, WriteOptions::default())
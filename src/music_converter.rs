@@ -93,19 +93,27 @@ fn check_filenames_are_unique(files: &[&Path]) -> Result<(), ConversionError> {
 fn convert_all_with_factory(
     source_files_in_album: &[&Path],
     destination_directory: &Path,
-    element_factory: &dyn ElementFactory,
+    element_factory: &(dyn ElementFactory + Sync),
 ) -> Result<Vec<ConvertedFile>, ConversionError> {
     check_directories_are_unique(source_files_in_album, destination_directory)?;
     check_filenames_are_unique(source_files_in_album)?;
 
+    // Analysis is a barrier for all conversions. Decoders apply the album gain that is written
+    // by the analysis, and most analyzers rewrite the source files in place.
     let analyzed_files = analyze(source_files_in_album, element_factory)?;
 
     info!("All music files ware analyzed.");
 
-    let converted_results = source_files_in_album
+    let conversion_targets: Vec<_> = source_files_in_album
         .iter()
         .zip(analyzed_files.iter())
-        .map(|(source_file, analyzed_file)| {
+        .collect();
+
+    // Each conversion runs external commands for a file. So files are converted in parallel.
+    let converted_results = utilities::map_in_parallel(
+        &conversion_targets,
+        utilities::get_max_workers(conversion_targets.len()),
+        |(source_file, analyzed_file)| {
             convert_to_mp3_from(
                 source_file,
                 analyzed_file,
@@ -123,8 +131,8 @@ fn convert_all_with_factory(
                 )
             })
             .inspect_err(|error| error!("Conversion was failed: {}", error))
-        })
-        .collect::<Vec<_>>();
+        },
+    );
 
     let destination_files = converted_results
         .iter()
@@ -199,11 +207,7 @@ fn get_output_mp3_path<T: AsRef<Path>, U: AsRef<Path>>(
         filename
     };
 
-    let mut destination_path = PathBuf::from(destination_directory);
-
-    destination_path.push(destination_filename);
-
-    Ok(destination_path)
+    Ok(destination_directory.join(destination_filename))
 }
 
 fn convert_to_mp3<T: AsRef<Path>, U: AsRef<Path>, V: AsRef<Path>>(
@@ -6,7 +6,11 @@
 
 use std::{
     ffi::OsStr,
+    num::NonZeroUsize,
+    panic,
     path::{Path, PathBuf},
+    sync::atomic::{AtomicUsize, Ordering},
+    thread,
 };
 
 use tempfile::{tempdir, TempDir};
@@ -32,7 +36,7 @@ pub fn filter_paths<T: AsRef<Path>>(paths: &[T]) -> Vec<PathBuf> {
     fn is_included_extension(extension: &OsStr) -> bool {
         !EXCLUDED_EXTENSIONS
             .iter()
-            .any(|excluded_extension| *excluded_extension == extension.to_ascii_lowercase())
+            .any(|excluded_extension| extension.eq_ignore_ascii_case(excluded_extension))
     }
 
     paths
@@ -47,6 +51,68 @@ pub fn filter_paths<T: AsRef<Path>>(paths: &[T]) -> Vec<PathBuf> {
         .collect()
 }
 
+/// Gets the number of workers that process `task_count` tasks in parallel.
+///
+/// The number is the available parallelism of the system. But it never exceeds `task_count`
+/// because an idle worker only costs its creation.
+pub fn get_max_workers(task_count: usize) -> usize {
+    thread::available_parallelism()
+        .map_or(1, NonZeroUsize::get)
+        .min(task_count)
+        .max(1)
+}
+
+/// Maps all `items` by `f` on `max_workers` threads.
+///
+/// Each worker takes the next item until all items are taken.
+/// The results are returned in the order of `items`.
+pub fn map_in_parallel<T, R, F>(items: &[T], max_workers: usize, f: F) -> Vec<R>
+where
+    T: Sync,
+    R: Send,
+    F: Fn(&T) -> R + Sync,
+{
+    let next_index = &AtomicUsize::new(0);
+    let f = &f;
+
+    let mut indexed_results = thread::scope(|scope| {
+        let workers: Vec<_> = (0..max_workers.clamp(1, items.len().max(1)))
+            .map(|_| {
+                scope.spawn(move || {
+                    let mut results = Vec::new();
+
+                    loop {
+                        let index = next_index.fetch_add(1, Ordering::Relaxed);
+                        let Some(item) = items.get(index) else {
+                            break;
+                        };
+
+                        results.push((index, f(item)));
+                    }
+
+                    results
+                })
+            })
+            .collect();
+
+        workers
+            .into_iter()
+            .flat_map(|worker| {
+                worker
+                    .join()
+                    .unwrap_or_else(|error| panic::resume_unwind(error))
+            })
+            .collect::<Vec<_>>()
+    });
+
+    indexed_results.sort_by_key(|(index, _)| *index);
+
+    indexed_results
+        .into_iter()
+        .map(|(_, result)| result)
+        .collect()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -74,4 +140,29 @@ mod tests {
         assert_eq!(1, result.len());
         assert!(result.contains(&mp3_path.to_path_buf()));
     }
+
+    #[test]
+    fn max_workers_do_not_exceed_tasks() {
+        assert_eq!(1, get_max_workers(1));
+        assert_eq!(1, get_max_workers(0));
+    }
+
+    #[test]
+    fn map_in_parallel_keeps_order() {
+        let items: Vec<_> = (0..100).collect();
+
+        let result = map_in_parallel(&items, 4, |item| item * 2);
+
+        assert_eq!(
+            items.iter().map(|item| item * 2).collect::<Vec<_>>(),
+            result
+        );
+    }
+
+    #[test]
+    fn map_in_parallel_without_items() {
+        let items: &[u32] = &[];
+
+        assert!(map_in_parallel(items, 4, |item| *item).is_empty());
+    }
 }